@@ -73,23 +73,17 @@ class ProfileReport(object):
                 if(type(df[column][0]) == str):
                     df[column] = df[column].str.strip()
             for column in df:
-                for j in range(len(df[column])):
-                    if(type(df[column][j]) == str):
-                        if(df[column][j] == "?"):
-                            missingCount['?'] += 1
-                            df.loc[j, column] = np.nan
-                        elif(df[column][j].lower() == "na"):
-                            missingCount['na'] += 1
-                            df.loc[j, column] = np.nan
-                        elif(df[column][j].lower() == "n/a"):
-                            missingCount['n/a'] += 1
-                            df.loc[j, column] = np.nan
-                        elif(df[column][j].lower() == "empty"):
-                            missingCount['empty'] += 1
-                            df.loc[j, column] = np.nan
-                        elif(df[column][j].lower() == "null"):
-                            missingCount['null'] += 1
-                            df.loc[j, column] = np.nan
+                # Check all the missing value tokens in a single pass over the values
+                # and replace the matches at once
+                missing = np.zeros(len(df[column]), dtype=bool)
+                for j, value in enumerate(df[column].values):
+                    if(type(value) == str):
+                        token = value.lower()
+                        if token in missingCount:
+                            missingCount[token] += 1
+                            missing[j] = True
+                if missing.any():
+                    df.loc[missing, column] = np.nan
             df = pd.read_csv(StringIO(df.to_csv(index=False, date_format='%Y-%m-%d %H:%M:%S')), parse_dates=list(df.select_dtypes(include=[np.datetime64]).columns))
         if "format_missing_values" in kwargs:
             kwargs.pop("format_missing_values")
@@ -46,7 +46,9 @@ def get_groupby_statistic(data):
         return _VALUE_COUNTS_MEMO[data.name]
 
     value_counts_with_nan = data.value_counts(dropna=False)
-    value_counts_without_nan = value_counts_with_nan.loc[value_counts_with_nan.index.dropna()]
+    # A boolean mask, as looking up the non-NaN labels with .loc would use a
+    # boolean index as a mask itself
+    value_counts_without_nan = value_counts_with_nan[pd.notnull(value_counts_with_nan.index)]
     distinct_count_with_nan = value_counts_with_nan.count()
 
     # When the inferred type of the index is just "mixed" probably the types within the series are tuple, dict, list and so on...
@@ -1,67 +1,267 @@
 # -*- coding: utf-8 -*-
 """Compute statistical description of datasets"""
 import multiprocessing
+from multiprocessing.pool import ThreadPool
 import itertools
+from collections import OrderedDict
 from functools import partial
 import numpy as np
 import pandas as pd
 import matplotlib
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
 from pkg_resources import resource_filename
 import pandas_profiling.formatters as formatters
 import pandas_profiling.base as base
-from pandas_profiling.plot import histogram, mini_histogram
+from pandas_profiling.plot import histogram, mini_histogram, LazyPlot, LazyBins
 
-def describe_numeric_1d(series, **kwargs):
+MISSING_VALUES = ["na", "?", np.nan, "missing", "not available", "n/a", "missing value"]
+"""list: The values considered as missing by the extended report"""
+
+def _numeric_moments(values):
+    """Compute the moments of each column of a 2D float array, ignoring NaN.
+
+    Each column is read twice: once for the count, sum, min, max and number of
+    zeros, once for the sums of the central powers and absolute deviations.
+    This is compiled with numba when it is installed.
+
+    Parameters
+    ----------
+    values : ndarray
+        The 2D float64 array, preferably in Fortran order.
+
+    Returns
+    -------
+    ndarray
+        The count, sum, min, max, number of zeros, sums of squared, cubed and
+        fourth powered deviations and sum of absolute deviations (as rows) of each column.
+    """
+    n_rows, n_cols = values.shape
+    moments = np.empty((9, n_cols))
+    for j in prange(n_cols):
+        count = 0
+        total = 0.0
+        minimum = np.inf
+        maximum = -np.inf
+        n_zeros = 0
+        for i in range(n_rows):
+            x = values[i, j]
+            if np.isnan(x):
+                continue
+            count += 1
+            total += x
+            if x < minimum:
+                minimum = x
+            if x > maximum:
+                maximum = x
+            if x == 0:
+                n_zeros += 1
+        mean = total / count if count > 0 else np.nan
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        abs_dev = 0.0
+        for i in range(n_rows):
+            x = values[i, j]
+            if np.isnan(x):
+                continue
+            dev = x - mean
+            dev2 = dev * dev
+            m2 += dev2
+            m3 += dev2 * dev
+            m4 += dev2 * dev2
+            abs_dev += abs(dev)
+        moments[0, j] = count
+        moments[1, j] = total
+        moments[2, j] = minimum
+        moments[3, j] = maximum
+        moments[4, j] = n_zeros
+        moments[5, j] = m2
+        moments[6, j] = m3
+        moments[7, j] = m4
+        moments[8, j] = abs_dev
+    return moments
+
+if njit is not None:
+    # fastmath is not used since it assumes there is no NaN to skip
+    _numeric_moments = njit(parallel=True, cache=True)(_numeric_moments)
+
+def _numeric_moments_numpy(values, chunksize=2 ** 18):
+    """Compute the moments of each column of a 2D float array, ignoring NaN.
+
+    Vectorized numpy counterpart of `_numeric_moments`, used when numba is not
+    installed. The rows are read by chunks, so the temporaries stay small
+    whatever the size of the array: a first pass accumulates the count, sum,
+    min, max and number of zeros, a second one the sums of the central powers.
+
+    Parameters
+    ----------
+    values : ndarray
+        The 2D float64 array.
+    chunksize : int
+        The approximate number of values processed at once.
+
+    Returns
+    -------
+    ndarray
+        The moments of each column, see `_numeric_moments`.
+    """
+    n_rows, n_cols = values.shape
+    step = max(1, chunksize // max(1, n_cols))
+    count = np.zeros(n_cols)
+    total = np.zeros(n_cols)
+    n_zeros = np.zeros(n_cols)
+    # fmin and fmax ignore NaN
+    minimum = np.full(n_cols, np.inf)
+    maximum = np.full(n_cols, -np.inf)
+    for start in range(0, n_rows, step):
+        chunk = values[start:start + step]
+        count += np.count_nonzero(~np.isnan(chunk), axis=0)
+        total += np.nansum(chunk, axis=0)
+        minimum = np.fmin(minimum, np.fmin.reduce(chunk, axis=0))
+        maximum = np.fmax(maximum, np.fmax.reduce(chunk, axis=0))
+        # NaN never compares equal to 0
+        n_zeros += np.count_nonzero(chunk == 0, axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / count
+    m2 = np.zeros(n_cols)
+    m3 = np.zeros(n_cols)
+    m4 = np.zeros(n_cols)
+    abs_dev = np.zeros(n_cols)
+    for start in range(0, n_rows, step):
+        dev = values[start:start + step] - mean
+        dev[np.isnan(dev)] = 0
+        dev2 = dev * dev
+        m2 += dev2.sum(axis=0)
+        m3 += (dev2 * dev).sum(axis=0)
+        m4 += (dev2 * dev2).sum(axis=0)
+        abs_dev += np.abs(dev).sum(axis=0)
+    return np.array([count, total, minimum, maximum, n_zeros, m2, m3, m4, abs_dev], dtype=np.float64)
+
+def _describe_moments(moments, index):
+    """Derive the summary statistics of numerical variables from their moments.
+
+    The formulas are the ones used by pandas (unbiased variance, skewness and kurtosis).
+
+    Parameters
+    ----------
+    moments : ndarray
+        The moments of the variables as returned by `_numeric_moments`.
+    index : Index
+        The names of the variables.
+
+    Returns
+    -------
+    dict
+        The statistics as Series with index being the variables.
+    """
+    count, total, minimum, maximum, n_zeros, m2, m3, m4, abs_dev = moments
+    stats = dict()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        stats['mean'] = total / count
+        stats['variance'] = np.where(count > 1, m2 / (count - 1), np.nan)
+        stats['std'] = np.sqrt(stats['variance'])
+        # Same floating point error correction as pandas, for the skewness
+        # and kurtosis only
+        m2 = np.where(np.abs(m2) < 1e-14, 0, m2)
+        skewness = count * (count - 1) ** 0.5 / (count - 2) * m3 / m2 ** 1.5
+        kurtosis = (count * (count + 1) * (count - 1) * m4 / ((count - 2) * (count - 3) * m2 ** 2)
+                    - 3 * (count - 1) ** 2 / ((count - 2) * (count - 3)))
+        stats['mad'] = abs_dev / count
+    stats['skewness'] = np.where(count < 3, np.nan, np.where(m2 == 0, 0, skewness))
+    stats['kurtosis'] = np.where(count < 4, np.nan, np.where(m2 == 0, 0, kurtosis))
+    stats['min'] = np.where(count > 0, minimum, np.nan)
+    stats['max'] = np.where(count > 0, maximum, np.nan)
+    stats['sum'] = total
+    stats['n_zeros'] = n_zeros
+    return {key: pd.Series(value, index=index) for key, value in stats.items()}
+
+def describe_numeric_nd(df):
+    """Compute summary statistics of numerical (`TYPE_NUM`) variables (a DataFrame).
+
+    The statistics of all the variables are computed at once from the float
+    values of the frame, by a compiled kernel when numba is installed or by
+    vectorized numpy reductions otherwise.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The numerical variables to describe.
+
+    Returns
+    -------
+    DataFrame
+        The description of the variables with index being the variables and columns being stats keys.
+    """
+    # Format a number as a percentage. For example 0.25 will be turned to 25%.
+    _percentile_format = "{:.0%}"
+    # Column major so that each variable is contiguous in memory
+    values = np.asfortranarray(df.values, dtype=np.float64)
+    if njit is not None:
+        moments = _numeric_moments(values)
+    else:
+        moments = _numeric_moments_numpy(values)
+    stats = _describe_moments(moments, df.columns)
+    # float64 cannot hold every int64, so the integer variables keep the exact
+    # min, max and sum of their integer values
+    int_df = df.select_dtypes(include=['integer'])
+    if len(int_df.columns) > 0:
+        for key, int_stat in [('min', int_df.min()), ('max', int_df.max()), ('sum', int_df.sum())]:
+            stats[key] = stats[key].astype(object)
+            stats[key].loc[int_df.columns] = int_stat.astype(object).values
+    stats['range'] = stats['max'] - stats['min']
+    # All the percentiles of all the variables are computed by a single call
+    percentiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+    quantiles = np.nanquantile(values, percentiles, axis=0)
+    for percentile, quantile in zip(percentiles, quantiles):
+        stats[_percentile_format.format(percentile)] = pd.Series(quantile, index=df.columns)
+    stats['iqr'] = pd.Series(quantiles[3] - quantiles[1], index=df.columns)
+    stats['cv'] = (stats['std'] / stats['mean']).where(stats['mean'] != 0)
+    stats['p_zeros'] = stats['n_zeros'] * 1.0 / len(df)
+    return pd.DataFrame(stats, index=df.columns)
+
+def describe_numeric_1d(series, numeric_stats=None, value_counts=None, **kwargs):
     """Compute summary statistics of a numerical (`TYPE_NUM`) variable (a Series).
 
-    Also create histograms (mini an full) of its distribution.
+    Also create histograms (mini an full) of its distribution, rendered lazily.
 
     Parameters
     ----------
     series : Series
         The variable to describe.
+    numeric_stats : Series
+        The statistics of the variable already computed by `describe_numeric_nd`.
+        They are computed here if not given (`None`).
+    value_counts : Series
+        Not used, accepted like the other `describe_*_1d` functions so that it
+        is not passed on to the histograms.
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
-    # Format a number as a percentage. For example 0.25 will be turned to 25%.
-    _percentile_format = "{:.0%}"
-    stats = dict()
+    if numeric_stats is None:
+        numeric_stats = describe_numeric_nd(series.to_frame()).iloc[0]
+    stats = numeric_stats.to_dict()
     stats['type'] = base.TYPE_NUM
-    stats['mean'] = series.mean()
-    stats['std'] = series.std()
-    stats['variance'] = series.var()
-    stats['min'] = series.min()
-    stats['max'] = series.max()
-    stats['range'] = stats['max'] - stats['min']
-    # To avoid to compute it several times
-    _series_no_na = series.dropna()
-    for percentile in np.array([0.05, 0.25, 0.5, 0.75, 0.95]):
-        # The dropna() is a workaround for https://github.com/pydata/pandas/issues/13098
-        stats[_percentile_format.format(percentile)] = _series_no_na.quantile(percentile)
-    stats['iqr'] = stats['75%'] - stats['25%']
-    stats['kurtosis'] = series.kurt()
-    stats['skewness'] = series.skew()
-    stats['sum'] = series.sum()
-    stats['mad'] = series.mad()
-    stats['cv'] = stats['std'] / stats['mean'] if stats['mean'] else np.NaN
-    stats['n_zeros'] = (len(series) - np.count_nonzero(series))
-    stats['p_zeros'] = stats['n_zeros'] * 1.0 / len(series)
-    # Histograms
-    stats['histogram'] = histogram(series, **kwargs)
-    stats['mini_histogram'] = mini_histogram(series, **kwargs)
-    return pd.Series(stats, name=series.name)
+    # Histograms, the data is binned once for both of them when the first one is rendered
+    binned = LazyBins(series, bins=kwargs.get('bins', 10))
+    stats['histogram'] = LazyPlot(histogram, series, binned=binned, **kwargs)
+    stats['mini_histogram'] = LazyPlot(mini_histogram, series, binned=binned, **kwargs)
+    return stats
 
 def table_data_format(df_orig, table = False):
     if(not table):
         return False
     metadata = []
     df = df_orig
-    df.replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                           "n/a", "missing value"], value=np.nan, inplace=True)
+    df.replace(to_replace=MISSING_VALUES, value=np.nan, inplace=True)
 
     for col in df.columns:
         df[col] = pd.to_numeric(df[col], errors='ignore')
@@ -75,8 +275,7 @@ def table_data_format(df_orig, table = False):
         helper['ascend'] = 0
         helper['name'] = key
         if(df.dtypes[col] == "object"):
-            df[col].replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                                        "n/a", "missing value"], value="missing value", inplace=True)
+            df[col].replace(to_replace=MISSING_VALUES, value="missing value", inplace=True)
             helper['datatype'] = 'string'
             helper['values'] = df[col].unique().tolist()
         elif(df.dtypes[col] == "int64"):
@@ -89,8 +288,7 @@ def table_data_format(df_orig, table = False):
             helper['max_val'] = df[col].max()
         metadata.append(helper)
 
-    df.replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                           "n/a", "missing value"], value="missing value", inplace=True)
+    df.replace(to_replace=MISSING_VALUES, value="missing value", inplace=True)
     data_array = []
     for row in range(df.shape[0]):
         aux = []
@@ -107,21 +305,21 @@ def bid_data_format(df, bid = False):
     last_index = 0
     keys = {}
 
-    df.replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                           "n/a", "missing value"], value=np.nan, inplace=True)
+    df.replace(to_replace=MISSING_VALUES, value=np.nan, inplace=True)
 
     for col in df.columns:
         df[col] = pd.to_numeric(df[col], errors='ignore')
 
     for col in df.columns:
         if df[col].dtype == "object":
-            df[col].replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                                        "n/a", "missing value"], value="missing value", inplace=True)
+            df[col].replace(to_replace=MISSING_VALUES, value="missing value", inplace=True)
+            # Compute the distinct values once and reuse them
+            uniques = df[col].unique()
             considered_cols.append(col)
-            keys[col] = {"values": df[col].unique().tolist(
-            ), "start_i": last_index, "end_i": last_index + df[col].unique().size}
-            last_index = last_index + df[col].unique().size
-            for item in df[col].unique():
+            keys[col] = {"values": uniques.tolist(
+            ), "start_i": last_index, "end_i": last_index + uniques.size}
+            last_index = last_index + uniques.size
+            for item in uniques:
                 count.append([col, item])
     data_array = np.zeros((len(count), len(count)))
 
@@ -135,10 +333,10 @@ def bid_data_format(df, bid = False):
     data_array += np.transpose(data_array)
     return keys, data_array.tolist()
 
-def describe_date_1d(series):
+def describe_date_1d(series, **kwargs):
     """Compute summary statistics of a date (`TYPE_DATE`) variable (a Series).
 
-    Also create histograms (mini an full) of its distribution.
+    Also create histograms (mini an full) of its distribution, rendered lazily.
 
     Parameters
     ----------
@@ -147,34 +345,40 @@ def describe_date_1d(series):
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
     stats = dict()
     stats['type'] = base.TYPE_DATE
-    stats['min'] = series.min()
-    stats['max'] = series.max()
+    # Reduce the underlying int64 nanoseconds instead of boxed Timestamps
+    int_values = series.dropna().values.view(np.int64)
+    stats['min'] = pd.Timestamp(int_values.min())
+    stats['max'] = pd.Timestamp(int_values.max())
     stats['range'] = stats['max'] - stats['min']
     # Histograms
-    stats['histogram'] = histogram(series)
-    stats['mini_histogram'] = mini_histogram(series)
-    return pd.Series(stats, name=series.name)
+    stats['histogram'] = LazyPlot(histogram, series)
+    stats['mini_histogram'] = LazyPlot(mini_histogram, series)
+    return stats
 
-def describe_categorical_1d(series):
+def describe_categorical_1d(series, value_counts=None, **kwargs):
     """Compute summary statistics of a categorical (`TYPE_CAT`) variable (a Series).
 
     Parameters
     ----------
     series : Series
         The variable to describe.
+    value_counts : Series
+        The value counts of the variable already computed by `describe_supported`.
+        They are computed here if not given (`None`).
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
+    if value_counts is None:
+        value_counts = base.get_groupby_statistic(series)[0]
     # Only run if at least 1 non-missing value
-    value_counts, distinct_count = base.get_groupby_statistic(series)
     top, freq = value_counts.index[0], value_counts.iloc[0]
     names = []
     result = []
@@ -183,22 +387,26 @@ def describe_categorical_1d(series):
         names += ['top', 'freq', 'type']
         result += [top, freq, base.TYPE_CAT]
 
-    return pd.Series(result, index=names, name=series.name)
+    return dict(zip(names, result))
 
-def describe_boolean_1d(series):
+def describe_boolean_1d(series, value_counts=None, **kwargs):
     """Compute summary statistics of a boolean (`TYPE_BOOL`) variable (a Series).
 
     Parameters
     ----------
     series : Series
         The variable to describe.
+    value_counts : Series
+        The value counts of the variable already computed by `describe_supported`.
+        They are computed here if not given (`None`).
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
-    value_counts, distinct_count = base.get_groupby_statistic(series)
+    if value_counts is None:
+        value_counts = base.get_groupby_statistic(series)[0]
     top, freq = value_counts.index[0], value_counts.iloc[0]
     # The mean of boolean is an interesting information
     mean = series.mean()
@@ -207,9 +415,9 @@ def describe_boolean_1d(series):
     names += ['top', 'freq', 'type', 'mean']
     result += [top, freq, base.TYPE_BOOL, mean]
 
-    return pd.Series(result, index=names, name=series.name)
+    return dict(zip(names, result))
 
-def describe_constant_1d(series):
+def describe_constant_1d(series, **kwargs):
     """Compute summary statistics of a constant (`S_TYPE_CONST`) variable (a Series).
 
     Parameters
@@ -219,12 +427,12 @@ def describe_constant_1d(series):
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
-    return pd.Series([base.S_TYPE_CONST], index=['type'], name=series.name)
+    return {'type': base.S_TYPE_CONST}
 
-def describe_unique_1d(series):
+def describe_unique_1d(series, **kwargs):
     """Compute summary statistics of a unique (`S_TYPE_UNIQUE`) variable (a Series).
 
     Parameters
@@ -234,38 +442,49 @@ def describe_unique_1d(series):
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
-    return pd.Series([base.S_TYPE_UNIQUE], index=['type'], name=series.name)
+    return {'type': base.S_TYPE_UNIQUE}
 
-def describe_supported(series, **kwargs):
+def describe_supported(series, n_infinite=0, **kwargs):
     """Compute summary statistics of a supported variable (a Series).
 
     Parameters
     ----------
     series : Series
         The variable to describe.
+    n_infinite : int
+        The number of infinite observations, counted before they were replaced by NaN.
 
     Returns
     -------
+    dict
+        The description of the variable with keys being stats keys.
     Series
-        The description of the variable as a Series with index being stats keys.
+        The value counts of the variable, without NaN.
     """
     leng = len(series)  # number of observations in the Series
     count = series.count()  # number of non-NaN observations in the Series
-    n_infinite = count - series.count()  # number of infinte observations in the Series
+    # The infinite values were replaced by NaN but are not missing
+    n_missing = leng - count - n_infinite
 
     value_counts, distinct_count = base.get_groupby_statistic(series)
     if count > distinct_count > 1:
-        mode = series.mode().iloc[0]
+        # The most frequent values are known from the value counts, as
+        # Series.mode the smallest one is kept in case of a tie
+        modes = value_counts.index[value_counts.values == value_counts.iloc[0]]
+        try:
+            mode = modes.min()
+        except TypeError:
+            mode = modes[0]
     else:
         mode = series[0]
 
     results_data = {'count': count,
                     'distinct_count': distinct_count,
-                    'p_missing': 1 - count * 1.0 / leng,
-                    'n_missing': leng - count,
+                    'p_missing': n_missing * 1.0 / leng,
+                    'n_missing': n_missing,
                     'p_infinite': n_infinite * 1.0 / leng,
                     'n_infinite': n_infinite,
                     'is_unique': distinct_count == leng,
@@ -277,28 +496,31 @@ def describe_supported(series, **kwargs):
     except:
         results_data['memorysize'] = 0
 
-    return pd.Series(results_data, name=series.name)
+    return results_data, value_counts
 
-def describe_unsupported(series, **kwargs):
+def describe_unsupported(series, n_infinite=0, **kwargs):
     """Compute summary statistics of a unsupported (`S_TYPE_UNSUPPORTED`) variable (a Series).
 
     Parameters
     ----------
     series : Series
         The variable to describe.
+    n_infinite : int
+        The number of infinite observations, counted before they were replaced by NaN.
 
     Returns
     -------
-    Series
-        The description of the variable as a Series with index being stats keys.
+    dict
+        The description of the variable with keys being stats keys.
     """
     leng = len(series)  # number of observations in the Series
     count = series.count()  # number of non-NaN observations in the Series
-    n_infinite = count - series.count()  # number of infinte observations in the Series
+    # The infinite values were replaced by NaN but are not missing
+    n_missing = leng - count - n_infinite
 
     results_data = {'count': count,
-                    'p_missing': 1 - count * 1.0 / leng,
-                    'n_missing': leng - count,
+                    'p_missing': n_missing * 1.0 / leng,
+                    'n_missing': n_missing,
                     'p_infinite': n_infinite * 1.0 / leng,
                     'n_infinite': n_infinite,
                     'type': base.S_TYPE_UNSUPPORTED}
@@ -309,9 +531,19 @@ def describe_unsupported(series, **kwargs):
     except:
         results_data['memorysize'] = 0
 
-    return pd.Series(results_data, name=series.name)
+    return results_data
+
+_DESCRIBE_BY_TYPE = {
+    base.S_TYPE_CONST: describe_constant_1d,
+    base.TYPE_BOOL: describe_boolean_1d,
+    base.TYPE_NUM: describe_numeric_1d,
+    base.TYPE_DATE: describe_date_1d,
+    base.S_TYPE_UNIQUE: describe_unique_1d,
+    base.TYPE_CAT: describe_categorical_1d,
+}
+"""dict: The function describing a supported variable of each type"""
 
-def describe_1d(data, **kwargs):
+def describe_1d(data, numeric_stats=None, n_infinite=None, return_value_counts=False, **kwargs):
     """Compute summary statistics of a variable (a Series).
 
     The description is different according to the type of the variable.
@@ -321,44 +553,89 @@ def describe_1d(data, **kwargs):
     ----------
     series : Series
         The variable to describe.
+    numeric_stats : Series
+        The statistics of a numerical variable already computed by `describe_numeric_nd`.
+    n_infinite : int
+        The number of infinite observations when they were already replaced by NaN.
+        They are counted and replaced here if not given (`None`).
+    return_value_counts : bool
+        Whether to also return the value counts of the variable.
 
     Returns
     -------
     Series
         The description of the variable as a Series with index being stats keys.
+    Series
+        The value counts of the variable without NaN (`None` if it is unsupported).
+        Only returned if `return_value_counts` is True.
     """
 
-    # Replace infinite values with NaNs to avoid issues with
-    # histograms later.
-    data.replace(to_replace=[np.inf, np.NINF, np.PINF], value=np.nan, inplace=True)
-
-    result = pd.Series({}, name=data.name)
+    if n_infinite is None:
+        # Replace infinite values with NaNs to avoid issues with
+        # histograms later, only floats can be infinite.
+        n_infinite = 0
+        if pd.api.types.is_float_dtype(data):
+            infinite = np.isinf(data.values)
+            n_infinite = np.count_nonzero(infinite)
+            if n_infinite > 0:
+                data = data.where(~infinite)
 
     vartype = base.get_vartype(data)
 
+    # The stats are gathered in a dict and the Series is only built once
     if vartype == base.S_TYPE_UNSUPPORTED:
-        result = result.append(describe_unsupported(data))
+        stats = describe_unsupported(data, n_infinite=n_infinite)
+        value_counts = None
     else:
-        result = result.append(describe_supported(data))
-
-        if vartype == base.S_TYPE_CONST:
-            result = result.append(describe_constant_1d(data))
-        elif vartype == base.TYPE_BOOL:
-            result = result.append(describe_boolean_1d(data))
-        elif vartype == base.TYPE_NUM:
-            result = result.append(describe_numeric_1d(data, **kwargs))
-        elif vartype == base.TYPE_DATE:
-            result = result.append(describe_date_1d(data))
-        elif vartype == base.S_TYPE_UNIQUE:
-            result = result.append(describe_unique_1d(data))
-        else:
-            # TYPE_CAT
-            result = result.append(describe_categorical_1d(data))
-
-    return result
+        stats, value_counts = describe_supported(data, n_infinite=n_infinite)
+        stats.update(_DESCRIBE_BY_TYPE[vartype](data, numeric_stats=numeric_stats, value_counts=value_counts,
+                                                **kwargs))
+
+    description = pd.Series(stats, name=data.name)
+    if return_value_counts:
+        return description, value_counts
+    return description
+
+def correlation_nd(df, method='pearson'):
+    """Compute the correlation matrix of the numerical variables of a DataFrame.
+
+    Without missing values the matrix is computed by a single matrix product of
+    the standardized values, otherwise the pairwise computation of pandas is used.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The data.
+    method : str
+        Either 'pearson' or 'spearman' (the Pearson correlation of the ranks).
+
+    Returns
+    -------
+    DataFrame
+        The correlation matrix.
+    """
+    num_df = df.select_dtypes(include=[np.number, 'bool'], exclude=['timedelta'])
+    values = num_df.values.astype(np.float64)
+    if np.isnan(values).any():
+        return num_df.corr(method=method)
+    if method == 'spearman':
+        values = num_df.rank().values
+    values = values - values.mean(axis=0)
+    norms = np.sqrt((values ** 2).sum(axis=0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Constant variables have no correlation (NaN)
+        values /= norms
+    corr = np.clip(np.dot(values.T, values), -1, 1)
+    np.fill_diagonal(corr, np.where(norms > 0, 1.0, np.nan))
+    return pd.DataFrame(corr, index=num_df.columns, columns=num_df.columns)
 
 def multiprocess_func(x, **kwargs):
-    return x[0], describe_1d(x[1], **kwargs)
+    name, series, numeric_stats, n_infinite = x
+    # The value counts computed while describing the variable are returned
+    # with the description for the frequency tables
+    description, value_counts = describe_1d(series, numeric_stats=numeric_stats, n_infinite=n_infinite,
+                                            return_value_counts=True, **kwargs)
+    return name, description, value_counts
 
 def bid_process_data(df):
     count = []
@@ -366,22 +643,22 @@ def bid_process_data(df):
     last_index = 0
     keys = {}
 
-    df.replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                           "n/a", "missing value"], value=np.nan, inplace=True)
+    df.replace(to_replace=MISSING_VALUES, value=np.nan, inplace=True)
 
     for col in df.columns:
         df[col] = pd.to_numeric(df[col], errors='ignore')
 
     for col in df.columns:
         if df[col].dtype == "object":
-            df[col].replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                                        "n/a", "missing value"], value="missing value", inplace=True)
-            if df[col].unique().size < 25:
+            df[col].replace(to_replace=MISSING_VALUES, value="missing value", inplace=True)
+            # Compute the distinct values once and reuse them
+            uniques = df[col].unique()
+            if uniques.size < 25:
                 considered_cols.append(col)
-                keys[col] = {"values": df[col].unique().tolist(
-                ), "start_i": last_index, "end_i": last_index + df[col].unique().size}
-                last_index = last_index + df[col].unique().size
-                for item in df[col].unique():
+                keys[col] = {"values": uniques.tolist(
+                ), "start_i": last_index, "end_i": last_index + uniques.size}
+                last_index = last_index + uniques.size
+                for item in uniques:
                     count.append([col, item])
     data_array = np.zeros((len(count), len(count)))
 
@@ -398,8 +675,7 @@ def bid_process_data(df):
 def build_table_data(df_orig):
     metadata = []
     df = df_orig
-    df.replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                           "n/a", "missing value"], value=np.nan, inplace=True)
+    df.replace(to_replace=MISSING_VALUES, value=np.nan, inplace=True)
 
     for col in df.columns:
         df[col] = pd.to_numeric(df[col], errors='ignore')
@@ -413,8 +689,7 @@ def build_table_data(df_orig):
         helper['ascend'] = 0
         helper['name'] = key
         if(df.dtypes[col] == "object"):
-            df[col].replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                                        "n/a", "missing value"], value="missing value", inplace=True)
+            df[col].replace(to_replace=MISSING_VALUES, value="missing value", inplace=True)
             helper['datatype'] = 'string'
             helper['values'] = df[col].unique().tolist()
         elif(df.dtypes[col] == "int64"):
@@ -427,8 +702,7 @@ def build_table_data(df_orig):
             helper['max_val'] = df[col].max()
         metadata.append(helper)
 
-    df.replace(to_replace=["na", "?", np.nan, "missing", "not available",
-                           "n/a", "missing value"], value="missing value", inplace=True)
+    df.replace(to_replace=MISSING_VALUES, value="missing value", inplace=True)
     data_array = []
     for row in range(df.shape[0]):
         aux = []
@@ -506,19 +780,46 @@ def describe(df, bins=10, check_correlation=True, correlation_threshold=0.9, cor
         kwargs.pop("extended_report")
 
     kwargs.update({'bins': bins})
+
+    # Replace infinite values with NaNs in all the float variables at once,
+    # after counting them, so that every following stat ignores them
+    float_columns = df.select_dtypes(include=['floating']).columns
+    float_values = df[float_columns].values
+    infinite = np.isinf(float_values)
+    n_infinite = pd.Series(np.count_nonzero(infinite, axis=0), index=float_columns)
+    if n_infinite.any():
+        np.copyto(float_values, np.nan, where=infinite)
+        df = df.copy()
+        df[float_columns] = float_values
+
+    # Bucket the variables by type in a single pass so that the numerical ones
+    # can be described all at once instead of column by column
+    vartypes = pd.Series({col: base.get_vartype(data) for col, data in df.iteritems()})
+    num_columns = vartypes[vartypes == base.TYPE_NUM].index
+    numeric_stats = pd.DataFrame()
+    if len(num_columns) > 0:
+        numeric_stats = describe_numeric_nd(df[num_columns])
+    columns = [(col, data, numeric_stats.loc[col] if col in numeric_stats.index else None,
+                n_infinite.get(col, 0))
+               for col, data in df.iteritems()]
+
     # Describe all variables in a univariate way
     if pool_size == 1:
         local_multiprocess_func = partial(multiprocess_func, **kwargs)
-        ldesc = {col: s for col, s in map(local_multiprocess_func, df.iteritems())}
+        results = list(map(local_multiprocess_func, columns))
     else:
-        pool = multiprocessing.Pool(pool_size)
+        # pandas and numpy reductions release the GIL so threads can share the
+        # DataFrame instead of pickling every column to worker processes
         local_multiprocess_func = partial(multiprocess_func, **kwargs)
-        ldesc = {col: s for col, s in pool.map(local_multiprocess_func, df.iteritems())}
+        pool = ThreadPool(pool_size)
+        results = pool.map(local_multiprocess_func, columns)
         pool.close()
+    ldesc = {col: s for col, s, _ in results}
+    freq = {col: value_counts for col, _, value_counts in results}
 
     # Get correlations
-    dfcorrPear = df.corr(method="pearson")
-    dfcorrSpear = df.corr(method="spearman")
+    dfcorrPear = correlation_nd(df, method="pearson")
+    dfcorrSpear = correlation_nd(df, method="spearman")
 
     # Check correlations between variable
     if check_correlation is True:
@@ -547,14 +848,11 @@ def describe(df, bins=10, check_correlation=True, correlation_threshold=0.9, cor
                 if confusion_matrix.values.diagonal().sum() == len(df):
                     ldesc[name1] = pd.Series(['RECODED', name2], index=['type', 'correlation_var'])
 
-    # Convert ldesc to a DataFrame
-    names = []
+    # Convert ldesc to a DataFrame, the union of the stats keys is built in
+    # linear time and every description is aligned on it at once
     ldesc_indexes = sorted([x.index for x in ldesc.values()], key=len)
-    for idxnames in ldesc_indexes:
-        for name in idxnames:
-            if name not in names:
-                names.append(name)
-    variable_stats = pd.concat(ldesc, join_axes=pd.Index([names]), axis=1)
+    names = list(OrderedDict.fromkeys(itertools.chain.from_iterable(ldesc_indexes)))
+    variable_stats = pd.DataFrame(ldesc, index=names)
     variable_stats.columns.names = df.columns.names
 
     # General statistics
@@ -563,8 +861,8 @@ def describe(df, bins=10, check_correlation=True, correlation_threshold=0.9, cor
     table_stats['n'] = len(df)
     table_stats['nvar'] = len(df.columns)
     table_stats['total_missing'] = variable_stats.loc['n_missing'].sum() / (table_stats['n'] * table_stats['nvar'])
-    unsupported_columns = variable_stats.transpose()[variable_stats.transpose().type != base.S_TYPE_UNSUPPORTED].index.tolist()
-    table_stats['n_duplicates'] = sum(df.duplicated(subset=unsupported_columns)) if len(unsupported_columns) > 0 else 0
+    supported_columns = variable_stats.transpose()[variable_stats.transpose().type != base.S_TYPE_UNSUPPORTED].index.tolist()
+    table_stats['n_duplicates'] = df.duplicated(subset=supported_columns).sum() if len(supported_columns) > 0 else 0
 
     memsize = df.memory_usage(index=True).sum()
     table_stats['memsize'] = formatters.fmt_bytesize(memsize)
@@ -577,7 +875,7 @@ def describe(df, bins=10, check_correlation=True, correlation_threshold=0.9, cor
     return {
         'table': table_stats,
         'variables': variable_stats.T,
-        'freq': {k: (base.get_groupby_statistic(df[k])[0] if variable_stats[k].type != base.S_TYPE_UNSUPPORTED else None) for k in df.columns},
+        'freq': freq,
         'correlations': {'pearson': dfcorrPear, 'spearman': dfcorrSpear},
         'dataframe': df,
         'bid': bid_data_format(df, extended),
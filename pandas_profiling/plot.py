@@ -2,11 +2,14 @@
 """Plot distribution of datasets"""
 
 import base64
+import threading
 from distutils.version import LooseVersion
-import pandas_profiling.base as base
+from functools import partial
 import matplotlib
 import numpy as np
 from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import missingno as msno
 # Fix #68, this call is not needed and brings side effects in some use cases
 # Backend name specifications are not case-sensitive; e.g., ‘GTKAgg’ and ‘gtkagg’ are equivalent.
@@ -25,7 +28,103 @@ try:
 except ImportError:
     from urllib.parse import quote
 
-def _plot_histogram(series, bins=10, figsize=(6, 4), facecolor='#337ab7'):
+# pyplot keeps a global state and is not thread-safe, histograms can be
+# rendered from several threads so their rendering must be serialized
+_PLOT_LOCK = threading.Lock()
+
+# One figure of each size is reused by all the histograms instead of
+# allocating (and closing) a figure per plot
+_FIGURES = {}
+
+class LazyPlot(object):
+    """A plot of the data which is only rendered when its image is needed.
+
+    The image is rendered the first time the object is converted to a string,
+    e.g. when the HTML report is generated, and then kept.
+
+    Parameters
+    ----------
+    plot_func : function
+        The function rendering the plot, `histogram` or `mini_histogram`.
+    series : Series
+        The data to plot.
+    """
+    def __init__(self, plot_func, series, **kwargs):
+        self._plot = partial(plot_func, series, **kwargs)
+        self._image = None
+
+    def render(self):
+        """Render the plot if not already done.
+
+        Returns
+        -------
+        str
+            The resulting image encoded as a string.
+        """
+        if self._image is None:
+            self._image = self._plot()
+            self._plot = None
+        return self._image
+
+    def __str__(self):
+        return self.render()
+
+class LazyBins(object):
+    """The counts and bin edges of numerical data, only computed when needed.
+
+    The full and mini histograms of a variable share one instance, so the
+    data is binned once when the first of them is rendered.
+
+    Parameters
+    ----------
+    series : Series
+        The data to bin.
+    bins : int
+        The number of bins.
+    """
+    def __init__(self, series, bins=10):
+        self._series = series
+        self._bins = bins
+        self._binned = None
+
+    def get(self):
+        """Bin the data if not already done.
+
+        Returns
+        -------
+        tuple
+            The counts and bin edges as returned by `np.histogram`.
+        """
+        if self._binned is None:
+            self._binned = np.histogram(self._series.dropna().values, bins=self._bins)
+            self._series = None
+        return self._binned
+
+def _get_figure(figsize):
+    """Return the cleared figure of the given size shared by the histograms.
+
+    The figure is not managed by pyplot so it is never displayed by a notebook.
+    It must only be used while holding `_PLOT_LOCK`.
+
+    Parameters
+    ----------
+    figsize : tuple
+        The size of the figure (width, height) in inches.
+
+    Returns
+    -------
+    matplotlib.Figure
+        The figure.
+    """
+    if figsize not in _FIGURES:
+        figure = Figure(figsize=figsize)
+        FigureCanvasAgg(figure)
+        _FIGURES[figsize] = figure
+    figure = _FIGURES[figsize]
+    figure.clf()
+    return figure
+
+def _plot_histogram(series, bins=10, figsize=(6, 4), facecolor='#337ab7', binned=None):
     """Plot an histogram from the data and return the AxesSubplot object.
 
     Parameters
@@ -36,25 +135,29 @@ def _plot_histogram(series, bins=10, figsize=(6, 4), facecolor='#337ab7'):
         The size of the figure (width, height) in inches, default (6,4)
     facecolor : str
         The color code.
+    binned : LazyBins
+        The binned numerical data, shared with the other histogram of the variable.
+        It is binned here if not given (`None`).
 
     Returns
     -------
     matplotlib.AxesSubplot
         The plot.
     """
-    if base.get_vartype(series) == base.TYPE_DATE:
-        # TODO: These calls should be merged
-        fig = plt.figure(figsize=figsize)
-        plot = fig.add_subplot(111)
-        plot.set_ylabel('Frequency')
+    plot = _get_figure(figsize).add_subplot(111)
+    plot.set_ylabel('Frequency')
+    # The dtype is checked since the plot may be rendered after the type cache was cleared
+    if np.issubdtype(series.dtype, np.datetime64):
         try:
             plot.hist(series.dropna().values, facecolor=facecolor, bins=bins)
         except TypeError: # matplotlib 1.4 can't plot dates so will show empty plot instead
             pass
     else:
-        plot = series.plot(kind='hist', figsize=figsize,
-                           facecolor=facecolor,
-                           bins=bins)  # TODO when running on server, send this off to a different thread
+        if binned is None:
+            binned = LazyBins(series, bins=bins)
+        counts, edges = binned.get()
+        # Draw the already counted bins, one bar per bin
+        plot.hist(edges[:-1], bins=edges, weights=counts, facecolor=facecolor)
     return plot
 
 
@@ -72,13 +175,13 @@ def histogram(series, **kwargs):
         The resulting image encoded as a string.
     """
     imgdata = BytesIO()
-    plot = _plot_histogram(series, **kwargs)
-    plot.figure.subplots_adjust(left=0.15, right=0.95, top=0.9, bottom=0.1, wspace=0, hspace=0)
-    plot.figure.savefig(imgdata)
+    with _PLOT_LOCK:
+        plot = _plot_histogram(series, **kwargs)
+        plot.figure.subplots_adjust(left=0.15, right=0.95, top=0.9, bottom=0.1, wspace=0, hspace=0)
+        plot.figure.savefig(imgdata)
     imgdata.seek(0)
     result_string = 'data:image/png;base64,' + quote(base64.b64encode(imgdata.getvalue()))
     # TODO Think about writing this to disk instead of caching them in strings
-    plt.close(plot.figure)
     return result_string
 
 
@@ -96,31 +199,31 @@ def mini_histogram(series, **kwargs):
         The resulting image encoded as a string.
     """
     imgdata = BytesIO()
-    #plot = _plot_histogram(series, figsize=(2, 0.75), **kwargs)
-    plot = _plot_histogram(series, figsize=(4, 2), **kwargs)
-    #plot.axes.get_yaxis().set_visible(False)
+    with _PLOT_LOCK:
+        #plot = _plot_histogram(series, figsize=(2, 0.75), **kwargs)
+        plot = _plot_histogram(series, figsize=(4, 2), **kwargs)
+        #plot.axes.get_yaxis().set_visible(False)
 
-    if LooseVersion(matplotlib.__version__) <= '1.5.9':
-        plot.set_axis_bgcolor("w")
-    else:
-        plot.set_facecolor("w")
-
-    xticks = plot.xaxis.get_major_ticks()
-    #for tick in xticks[1:-1]:
-    #    tick.set_visible(False)
-    #    tick.label.set_visible(False)
-    for tick in (xticks[0], xticks[-1]):
-        tick.label.set_fontsize(8)
-    every_nth = 2
-    for n, label in enumerate(plot.xaxis.get_ticklabels()):
-        if n % every_nth == 0:
-            label.set_visible(False)
-    #plot.figure.subplots_adjust(left=0.15, right=0.85, top=1, bottom=0.35, wspace=0, hspace=0)
-    plot.figure.subplots_adjust(left=0.2, right=0.95, top=0.95 , wspace=0, hspace=0)
-    plot.figure.savefig(imgdata)
+        if LooseVersion(matplotlib.__version__) <= '1.5.9':
+            plot.set_axis_bgcolor("w")
+        else:
+            plot.set_facecolor("w")
+
+        xticks = plot.xaxis.get_major_ticks()
+        #for tick in xticks[1:-1]:
+        #    tick.set_visible(False)
+        #    tick.label.set_visible(False)
+        for tick in (xticks[0], xticks[-1]):
+            tick.label.set_fontsize(8)
+        every_nth = 2
+        for n, label in enumerate(plot.xaxis.get_ticklabels()):
+            if n % every_nth == 0:
+                label.set_visible(False)
+        #plot.figure.subplots_adjust(left=0.15, right=0.85, top=1, bottom=0.35, wspace=0, hspace=0)
+        plot.figure.subplots_adjust(left=0.2, right=0.95, top=0.95 , wspace=0, hspace=0)
+        plot.figure.savefig(imgdata)
     imgdata.seek(0)
     result_string = 'data:image/png;base64,' + quote(base64.b64encode(imgdata.getvalue()))
-    plt.close(plot.figure)
     return result_string
 
 def correlation_matrix(corrdf, title, **kwargs):
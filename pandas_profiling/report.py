@@ -215,7 +215,7 @@ def to_html(sample, stats_object, missing_count):
         pearson_matrix = plot.correlation_matrix(stats_object['correlations']['pearson'], 'Pearson')
         spearman_matrix = plot.correlation_matrix(stats_object['correlations']['spearman'], 'Spearman')
         correlations_html = templates.template('correlations').render(
-            values={'pearson_matrix': pearson_matrix, 'pearson_numeric': df.corr().to_html(), 'spearman_matrix': spearman_matrix})
+            values={'pearson_matrix': pearson_matrix, 'pearson_numeric': stats_object['correlations']['pearson'].to_html(), 'spearman_matrix': spearman_matrix})
 
     # Add sample
     sample_html = templates.template('sample').render(sample_table_html=sample.to_html(classes="sample"))
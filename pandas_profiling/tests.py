@@ -8,7 +8,8 @@ import pandas as pd
 from pandas import Series
 import six
 import pandas_profiling
-from pandas_profiling.describe import describe, describe_1d
+from pandas_profiling.describe import describe, describe_1d, describe_numeric_nd, correlation_nd
+from pandas_profiling.describe import _numeric_moments, _numeric_moments_numpy, _describe_moments
 from pandas_profiling.report import to_html
 import tempfile
 import shutil
@@ -243,9 +244,9 @@ class DataFrameTest(unittest.TestCase):
                         self.results['variables'].loc[col][k], k, col))
 
             if self.results['variables'].loc[col]['type'] in ['NUM', 'DATE']:
-                self.assertLess(200, len(self.results['variables'].loc[col]["histogram"]),
+                self.assertLess(200, len(str(self.results['variables'].loc[col]["histogram"])),
                                 "Histogram missing for column %s " % col)
-                self.assertLess(200, len(self.results['variables'].loc[col]["mini_histogram"]),
+                self.assertLess(200, len(str(self.results['variables'].loc[col]["mini_histogram"])),
                                 "Mini-histogram missing for column %s " % col)
 
     def test_html_report(self):
@@ -256,6 +257,27 @@ class DataFrameTest(unittest.TestCase):
         self.results = describe(self.df, bins=100)
         self.test_describe_df()
 
+    def test_percentiles(self):
+        for col in ['x', 'y']:
+            for percentile in [0.05, 0.25, 0.5, 0.75, 0.95]:
+                self.assertAlmostEqual(self.results['variables'].loc[col]["{:.0%}".format(percentile)],
+                                       self.df[col].quantile(percentile))
+            self.assertAlmostEqual(self.results['variables'].loc[col]['iqr'],
+                                   self.df[col].quantile(0.75) - self.df[col].quantile(0.25))
+
+    def test_lazy_histogram(self):
+        histogram = self.results['variables'].loc['x']['histogram']
+        # Nothing is rendered by describe, only when the image is needed
+        self.assertIsNone(histogram._image)
+        self.assertIsNone(histogram._plot.keywords['binned']._binned)
+        self.assertTrue(str(histogram).startswith('data:image/png'))
+
+    def test_duplicates(self):
+        # 1 and '1' are different values
+        self.assertEqual(describe(pd.DataFrame({'m': [1, '1', 'x', 'y']}))['table']['n_duplicates'], 0)
+        # 0.0 and -0.0 are the same value
+        self.assertEqual(describe(pd.DataFrame({'z': [0.0, -0.0, 1, 2]}))['table']['n_duplicates'], 1)
+
     def test_export_to_file(self):
 
         p = pandas_profiling.ProfileReport(self.df)
@@ -310,10 +332,102 @@ class Describe1dTest(unittest.TestCase):
         # Non unique values including non unique nan
         self._assert_unique(pd.Series([1, 2, 2, np.nan, np.nan]), False, 3/5)
 
+    def test_infinite(self):
+        """Test the count of infinite values of 1D data"""
+        desc_1d = describe_1d(pd.Series([1, np.inf, 2, -np.inf, 3, np.nan]))
+        self.assertEqual(desc_1d['n_infinite'], 2)
+        self.assertEqual(desc_1d['p_infinite'], 2/6)
+        self.assertEqual(desc_1d['count'], 3)
+        # The infinite values are not counted as missing
+        self.assertEqual(desc_1d['n_missing'], 1)
+        self.assertEqual(desc_1d['p_missing'], 1/6)
+
+    def test_mode(self):
+        """Test the mode of 1D data"""
+        self.assertEqual(describe_1d(pd.Series([3, 2, 3, 1, 3, np.nan]))['mode'], 3)
+        # The smallest value is the mode in case of a tie
+        self.assertEqual(describe_1d(pd.Series([3, 3, 1, 1, 2]))['mode'], 1)
+        self.assertEqual(describe_1d(pd.Series(['b', 'b', 'a', 'a', 'c']))['mode'], 'a')
+        self.assertEqual(describe_1d(pd.Series([False] * 7 + [True] * 3))['mode'], False)
+
     def _assert_unique(self, data, is_unique, p_unique):
         desc_1d = describe_1d(data)
         self.assertEqual(desc_1d['is_unique'], is_unique)
         self.assertEqual(desc_1d['p_unique'], p_unique)
 
+
+class NumericMomentsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'nan': [1.5, -2, 3, np.nan, 10, 0],
+            'all_nan': [np.nan] * 6,
+            'one': [np.nan, np.nan, 4, np.nan, np.nan, np.nan],
+            'two': [1, np.nan, np.nan, 5, np.nan, np.nan],
+            'three': [1, 2, np.nan, 7, np.nan, np.nan],
+            'const': [3, 3, np.nan, 3, 3, 3],
+            'small': [1e-9, 2e-9, np.nan, 3e-9, 5e-9, 8e-9],
+        })
+
+    def test_moments(self):
+        """Test the moment kernels against the pandas reductions"""
+        # The plain Python kernel is tested as well when numba compiled it
+        kernels = [_numeric_moments, getattr(_numeric_moments, 'py_func', _numeric_moments), _numeric_moments_numpy]
+        expected = {'mean': self.df.mean(), 'std': self.df.std(), 'variance': self.df.var(),
+                    'skewness': self.df.skew(), 'kurtosis': self.df.kurt(), 'mad': self.df.mad(),
+                    'min': self.df.min(), 'max': self.df.max(), 'sum': self.df.sum()}
+        values = np.asfortranarray(self.df.values, dtype=np.float64)
+        for kernel in kernels:
+            stats = _describe_moments(kernel(values), self.df.columns)
+            for key, value in expected.items():
+                np.testing.assert_allclose(stats[key].values, value.values, err_msg=key)
+            self.assertEqual(stats['n_zeros'].tolist(), [int(col == 'nan') for col in self.df.columns])
+
+    def test_integer_exactness(self):
+        """Test that the min, max and sum of integers do not go through float64"""
+        stats = describe_numeric_nd(pd.DataFrame({'big': [2 ** 60 + 1, 2 ** 60 + 3, 7]})).loc['big']
+        self.assertEqual(stats['min'], 7)
+        self.assertEqual(stats['max'], 2 ** 60 + 3)
+        self.assertEqual(stats['sum'], 2 ** 61 + 11)
+        self.assertEqual(stats['range'], 2 ** 60 - 4)
+
+    def test_percentiles(self):
+        """Test the percentiles of a frame mixing integer and float variables"""
+        df = pd.DataFrame({'int': np.arange(100), 'float': np.linspace(-1, 3, 100) ** 3})
+        df.loc[::7, 'float'] = np.nan
+        stats = describe_numeric_nd(df)
+        for percentile in [0.05, 0.25, 0.5, 0.75, 0.95]:
+            np.testing.assert_allclose(stats["{:.0%}".format(percentile)].astype(float).values,
+                                       df.quantile(percentile).values)
+        np.testing.assert_allclose(stats['iqr'].astype(float).values,
+                                   (df.quantile(0.75) - df.quantile(0.25)).values)
+
+
+class CorrelationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'x': [1.5, 2, -3, 4, 10, 0],
+            'y': [2, 1, 4, 3, 5, 2],
+            'const': [7] * 6,
+            'bool': [True, False, True, True, False, False],
+            'cat': ['a', 'b', 'c', 'd', 'e', 'f'],
+        })
+
+    def test_correlation_nd(self):
+        """Test the correlation matrices against DataFrame.corr"""
+        for method in ['pearson', 'spearman']:
+            corr = correlation_nd(self.df, method=method)
+            pd.util.testing.assert_frame_equal(corr, self.df.corr(method=method))
+            # A constant variable has no correlation, not even with itself
+            self.assertTrue(corr.loc['const'].isnull().all())
+            self.assertTrue(corr['const'].isnull().all())
+
+    def test_correlation_nd_nan(self):
+        """Test the fallback to DataFrame.corr with missing values"""
+        self.df.loc[2, 'x'] = np.nan
+        for method in ['pearson', 'spearman']:
+            pd.util.testing.assert_frame_equal(correlation_nd(self.df, method=method), self.df.corr(method=method))
+
 if __name__ == '__main__':
     unittest.main()
@@ -17,6 +17,7 @@ setup(
     license='MIT',
     description='Generate profile report for pandas DataFrame',
     install_requires=[
+        "numpy>=1.15",
         "pandas>=0.19",
         "matplotlib>=1.4",
         "jinja2>=2.8",